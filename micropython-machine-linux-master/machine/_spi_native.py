@@ -0,0 +1,15 @@
+# Native code emitter fast paths for machine.spi. Importing this module fails
+# with SyntaxError on MicroPython builds without a native emitter, and with
+# ImportError outside MicroPython, in which case machine.spi falls back to
+# plain bytecode.
+import micropython
+
+@micropython.viper
+def fill_xfer(buf: ptr32, tx: uint, rx: uint, length: uint):
+    # tx_buf, rx_buf and len of a spi_ioc_transfer, as 32-bit words. The
+    # upper words are shifted in two steps, so they are 0 where uint is 32-bit.
+    buf[0] = tx
+    buf[1] = (tx >> 16) >> 16
+    buf[2] = rx
+    buf[3] = (rx >> 16) >> 16
+    buf[4] = length
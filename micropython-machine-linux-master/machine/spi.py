@@ -1,21 +1,64 @@
 import os
 import fcntl
 import array
+import struct
 import uctypes as ctypes
+try:
+    # Viper fast path, which only compiles on builds with a native code emitter
+    from machine._spi_native import fill_xfer as _fill_xfer
+except (ImportError, SyntaxError):
+    _fill_xfer = None
+
+# Constants scraped from <linux/spi/spidev.h>
+_SPI_CPHA                   = 0x1
+_SPI_CPOL                   = 0x2
+_SPI_LSB_FIRST              = 0x8
+_SPI_IOC_WR_MODE            = 0x40016b01
+_SPI_IOC_RD_MODE            = 0x80016b01
+_SPI_IOC_WR_MAX_SPEED_HZ    = 0x40046b04
+_SPI_IOC_RD_MAX_SPEED_HZ    = 0x80046b04
+_SPI_IOC_WR_BITS_PER_WORD   = 0x40016b03
+_SPI_IOC_RD_BITS_PER_WORD   = 0x80016b03
+_SPI_IOC_MESSAGE_1          = 0x40206b00
+_SPI_IOC_TRANSFER_SIZE      = 32
+# struct spi_ioc_transfer: tx_buf, rx_buf, len, speed_hz, delay_usecs,
+# bits_per_word, cs_change, tx_nbits, rx_nbits, pad
+_SPI_IOC_TRANSFER_FMT       = "<QQIIHBBBBH"
+_SPI_IOC_MESSAGE_MAX        = 511
+
+# Valid SPI modes, and mode bits for each accepted spelling of a bit order
+_VALID_MODES = frozenset((0, 1, 2, 3))
+_BIT_ORDER = {"msb": 0, "MSB": 0, "lsb": _SPI_LSB_FIRST, "LSB": _SPI_LSB_FIRST}
+
+def _bit_order_flag(bit_order):
+    # Mode bits for `bit_order` in any case, or None if it is invalid
+    try:
+        return _BIT_ORDER[bit_order]
+    except KeyError:
+        return _BIT_ORDER.get(bit_order.lower())
+
+# Bound once so the property accessors avoid the module attribute lookup
+_ioctl = fcntl.ioctl
+
+def _SPI_IOC_MESSAGE(n):
+    # _IOW(SPI_IOC_MAGIC, 0, char[SPI_MSGSIZE(n)])
+    return 0x40006b00 | ((n * _SPI_IOC_TRANSFER_SIZE) << 16)
+
+def _transfer_buffer(data, mutable=True):
+    # Buffer to hand to spidev for `data`, copied only if it must be mutable
+    if isinstance(data, bytearray):
+        return data
+    elif isinstance(data, bytes):
+        return bytearray(data) if mutable else data
+    elif isinstance(data, list):
+        try:
+            return array.array('B', data)
+        except OverflowError:
+            raise ValueError("Invalid data bytes.")
 
-class SPI(object):
-    # Constants scraped from <linux/spi/spidev.h>
-    _SPI_CPHA                   = 0x1
-    _SPI_CPOL                   = 0x2
-    _SPI_LSB_FIRST              = 0x8
-    _SPI_IOC_WR_MODE            = 0x40016b01
-    _SPI_IOC_RD_MODE            = 0x80016b01
-    _SPI_IOC_WR_baudrate_HZ    = 0x40046b04
-    _SPI_IOC_RD_baudrate_HZ    = 0x80046b04
-    _SPI_IOC_WR_BITS_PER_WORD   = 0x40016b03
-    _SPI_IOC_RD_BITS_PER_WORD   = 0x80016b03
-    _SPI_IOC_MESSAGE_1          = 0x40206b00
+    raise TypeError("Invalid data type, should be bytes, bytearray, or list.")
 
+class SPI(object):
     desc = {
         'tx_buf': ctypes.UINT64 | 0,
         'rx_buf': ctypes.UINT64 | 8,
@@ -25,10 +68,9 @@ class SPI(object):
         'bits_per_word': ctypes.UINT8 | 26,
         'cs_change': ctypes.UINT8 | 27,
         'tx_nbits': ctypes.UINT8 | 28,
-        'rx_nbits': ctypes.UINT8 | 28,
+        'rx_nbits': ctypes.UINT8 | 29,
         'pad': ctypes.UINT16 | 30,
     }
-    xfer_data = bytearray(32)
 
     def __init__(self, devpath, mode=0, baudrate=1000, bit_order="msb", bits_per_word=8, extra_flags=0):
         """Instantiate a SPI object and open the spidev device at the specified
@@ -54,16 +96,28 @@ class SPI(object):
         """
         self._fd = None
         self._devpath = None
+        # Scratch buffers reused by the property accessors
+        self._u8 = array.array('B', [0])
+        self._u32 = array.array('I', [0])
+        # Last mode byte written, so the mode, bit order and extra flags setters
+        # can skip the read half of their read-modify-write. This assumes this
+        # object is the only user of its spidev file descriptor.
+        self._mode_shadow = 0
+        # Transfer structure for send_recv, speed and bits per word kept in sync by the setters
+        self._xfer_buf = bytearray(_SPI_IOC_TRANSFER_SIZE)
+        self._xfer = ctypes.struct(ctypes.addressof(self._xfer_buf), SPI.desc, ctypes.LITTLE_ENDIAN)
+        # Grow-only buffer that bytes transfers are shifted in to
+        self._rx_pool = bytearray(64)
         self._open(devpath, mode, baudrate, bit_order, bits_per_word, extra_flags)
 
     def __del__(self):
-        self.close()
+        self.deinit()
 
     def __enter__(self):
-        pass
+        return self
 
     def __exit__(self, t, value, traceback):
-        self.close()
+        self.deinit()
 
     def _open(self, devpath, mode, baudrate, bit_order, bits_per_word, extra_flags):
         if not isinstance(devpath, str):
@@ -79,9 +133,9 @@ class SPI(object):
         elif not isinstance(extra_flags, int):
             raise TypeError("Invalid extra_flags type, should be integer.")
 
-        if mode not in [0, 1, 2, 3]:
+        if mode not in _VALID_MODES:
             raise ValueError("Invalid mode, can be 0, 1, 2, 3.")
-        elif bit_order.lower() not in ["msb", "lsb"]:
+        elif _bit_order_flag(bit_order) is None:
             raise ValueError("Invalid bit_order, can be \"msb\" or \"lsb\".")
         elif bits_per_word < 0 or bits_per_word > 255:
             raise ValueError("Invalid bits_per_word, must be 0-255.")
@@ -96,84 +150,274 @@ class SPI(object):
 
         self._devpath = devpath
 
-        bit_order = bit_order.lower()
-
         # Set mode, bit order, extra flags
-        buf = array.array("B", [mode | (SPI._SPI_LSB_FIRST if bit_order == "lsb" else 0) | extra_flags])
-        try:
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_WR_MODE, buf, True)
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_RD_MODE, buf, True)
-        except OSError as e:
-            raise OSError("Setting SPI mode: error")
+        self._write_mode(mode | _bit_order_flag(bit_order) | extra_flags)
 
-        # Set max speed
-        buf = array.array("I", [int(baudrate)])
-        try:
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_WR_baudrate_HZ, buf, True)
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_RD_baudrate_HZ, buf, True)
-        except OSError as e:
-            raise OSError("Setting SPI max speed: error")
-
-        # Set bits per word
-        buf = array.array("B", [bits_per_word])
-        try:
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_WR_BITS_PER_WORD, buf, True)
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_RD_BITS_PER_WORD, buf, True)
-        except OSError as e:
-            raise OSError("Setting SPI bits per word: error")
+        # Set max speed and bits per word, arguments are already validated
+        self._set_baudrate_fast(int(baudrate))
+        self._set_bits_per_word_fast(bits_per_word)
 
     # Methods
 
     def send_recv(self, data, recv=None):
         """Shift out `data` and return shifted in data.
 
+        A `bytearray` is transferred in place, so the shifted in data
+        overwrites `data` unless `recv` is given.
+
         Args:
             data (bytes, bytearray, list): a byte array or list of 8-bit integers to shift out.
+            recv (bytearray): optional buffer to shift data in to, at least as long as `data`.
 
         Returns:
-            bytes, bytearray, list: data shifted in.
+            bytes, bytearray, list: data shifted in, or None if `recv` is given.
 
         Raises:
             OSError: if an I/O or OS error occurs.
-            TypeError: if `data` type is invalid.
-            ValueError: if data is not valid bytes.
+            TypeError: if `data` or `recv` type is invalid.
+            ValueError: if data is not valid bytes, or if `recv` is too short.
 
         """
-        if not isinstance(data, (bytes, bytearray, list)):
-            raise TypeError("Invalid data type, should be bytes, bytearray, or list.")
+        if recv is not None:
+            # Shift in to `recv`, so `data` is only read
+            if not isinstance(recv, bytearray):
+                raise TypeError("Invalid recv type, should be bytearray.")
 
-        # Create mutable array
+            buf = _transfer_buffer(data, False)
+            if len(recv) < len(buf):
+                raise ValueError("Invalid recv length, should be at least the data length.")
+
+            self._transfer(ctypes.addressof(buf), ctypes.addressof(recv), len(buf))
+            return
+
+        # Dispatch on the exact type first, so the common types skip the isinstance checks
+        try:
+            send_recv = SPI._SEND_RECV[type(data)]
+        except KeyError:
+            for t in (bytes, bytearray, list):
+                if isinstance(data, t):
+                    send_recv = SPI._SEND_RECV[t]
+                    break
+            else:
+                raise TypeError("Invalid data type, should be bytes, bytearray, or list.")
+
+        return send_recv(self, data)
+
+    # send_recv specializations, each returning the same type as `data`
+
+    def _send_recv_bytes(self, data):
+        # Shift out of `data` itself and in to the pooled buffer, then copy out once
+        n = len(data)
+        pool = self._rx_pool
+        if n > len(pool):
+            pool = self._rx_pool = bytearray(max(n, 2 * len(pool)))
+
+        self._transfer(ctypes.addressof(data), ctypes.addressof(pool), n)
+        return bytes(memoryview(pool)[:n])
+
+    def _send_recv_bytearray(self, data):
+        # Transfer in place
+        buf_addr = ctypes.addressof(data)
+        self._transfer(buf_addr, buf_addr, len(data))
+        return data
+
+    def _send_recv_list(self, data):
+        # Transfer in place over an array, which also range checks the items
         try:
             buf = array.array('B', data)
         except OverflowError:
             raise ValueError("Invalid data bytes.")
 
         buf_addr = ctypes.addressof(buf)
-        buf_in = bytearray(len(buf))
-        buf_in_addr = ctypes.addressof(buf_in)
+        self._transfer(buf_addr, buf_addr, len(buf))
+        return list(buf)
+
+    # Static dispatch table, so specializing needs no code generation with exec
+    _SEND_RECV = {
+        bytes: _send_recv_bytes,
+        bytearray: _send_recv_bytearray,
+        list: _send_recv_list,
+    }
+
+    def send(self, data):
+        """Shift out `data`, discarding the shifted in data.
+
+        Args:
+            data (bytes, bytearray, list): a byte array or list of 8-bit integers to shift out.
+
+        Raises:
+            OSError: if an I/O or OS error occurs.
+            TypeError: if `data` type is invalid.
+            ValueError: if data is not valid bytes.
+
+        """
+        # Write-only, rx_buf NULL makes spidev discard the shifted in data
+        buf = _transfer_buffer(data, False)
+        self._transfer(ctypes.addressof(buf), 0, len(buf))
+
+    def write_raw(self, data):
+        """Shift out `data` with a plain write() on the spidev device,
+        discarding the shifted in data.
+
+        This skips the transfer structure entirely and uses the device
+        speed and bits per word, which are the ones configured through this
+        object. spidev limits a single write to its `bufsiz` module
+        parameter, 4096 bytes by default.
+
+        Args:
+            data (bytes, bytearray, list): a byte array or list of 8-bit integers to shift out.
+
+        Raises:
+            OSError: if an I/O or OS error occurs.
+            TypeError: if `data` type is invalid.
+            ValueError: if data is not valid bytes.
+
+        """
+        buf = _transfer_buffer(data, False)
+
+        try:
+            os.write(self._fd, buf)
+        except OSError as e:
+            raise OSError("SPI write: error")
+
+    def send_recv_many(self, segments):
+        """Shift out each of `segments` in a single spidev message and return
+        the shifted in data of each. Chip select stays asserted across the
+        segments, and each segment is handled as with `send_recv`. spidev
+        limits the total length of all segments to its `bufsiz` module
+        parameter, 4096 bytes by default.
+
+        Args:
+            segments (list): list of bytes, bytearray, or list of 8-bit integers to shift out.
+
+        Returns:
+            list: data shifted in for each segment, with the same type as the segment.
+
+        Raises:
+            OSError: if an I/O or OS error occurs.
+            TypeError: if `segments` or segment data type is invalid.
+            ValueError: if `segments` length is invalid, or if segment data is not valid bytes.
+
+        """
+        return self._message(segments, True)
+
+    def write_many(self, segments):
+        """Shift out each of `segments` in a single spidev message, discarding
+        the shifted in data. Chip select stays asserted across the segments.
+        spidev limits the total length of all segments to its `bufsiz`
+        module parameter, 4096 bytes by default.
+
+        Args:
+            segments (list): list of bytes, bytearray, or list of 8-bit integers to shift out.
+
+        Raises:
+            OSError: if an I/O or OS error occurs.
+            TypeError: if `segments` or segment data type is invalid.
+            ValueError: if `segments` length is invalid, or if segment data is not valid bytes.
+
+        """
+        self._message(segments, False)
 
-        # Prepare transfer structure
-        spi_xfer = ctypes.struct(ctypes.addressof(SPI.xfer_data), SPI.desc, ctypes.LITTLE_ENDIAN)
-        spi_xfer.tx_buf = buf_addr
-        spi_xfer.rx_buf = buf_in_addr
-        spi_xfer.len = len(buf)
+    def batch(self, size=16):
+        """Return a context manager that queues transfers and shifts them out
+        in a single spidev message when the `with` block exits. As with
+        `send_recv_many`, spidev limits the total length of the queued
+        transfers to its `bufsiz` module parameter, 4096 bytes by default.
+
+            with spi.batch() as b:
+                b.write(cmd)
+                rx = b.send(cmd2)
+            value = rx[0]
+
+        Args:
+            size (int): number of transfers to preallocate descriptors for.
+
+        Returns:
+            SPI.Batch: Batch object.
+
+        Raises:
+            TypeError: if `size` type is not int.
+            ValueError: if `size` value is invalid.
+
+        """
+        return SPI.Batch(self, size)
+
+    def _transfer(self, tx_addr, rx_addr, length):
+        # Single transfer over the preconfigured structure, speed and bits per word are sticky
+        if _fill_xfer is not None:
+            _fill_xfer(self._xfer_buf, tx_addr, rx_addr, length)
+        else:
+            # tx_buf, rx_buf and len, the leading fields of _SPI_IOC_TRANSFER_FMT
+            struct.pack_into("<QQI", self._xfer_buf, 0, tx_addr, rx_addr, length)
 
         # Transfer
         try:
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_MESSAGE_1, spi_xfer, True)
+            _ioctl(self._fd, _SPI_IOC_MESSAGE_1, self._xfer_buf, True)
         except OSError as e:
             raise OSError("SPI transfer: error")
 
-        if recv is not None:
-            recv = bytearray(buf_in)
-        else:
-            # Return shifted out data with the same type as shifted in data
-            if isinstance(data, bytes):
-                return bytes(bytearray(buf_in))
-            elif isinstance(data, bytearray):
-                return bytearray(buf_in)
-            elif isinstance(data, list):
-                return buf_in.tolist()
+    def _message(self, segments, recv):
+        if not isinstance(segments, list):
+            raise TypeError("Invalid segments type, should be list.")
+        elif len(segments) == 0 or len(segments) > _SPI_IOC_MESSAGE_MAX:
+            raise ValueError("Invalid segments length, must be 1-%d." % _SPI_IOC_MESSAGE_MAX)
+
+        # Write-only and bytes segments are never written by the kernel, so need no copy
+        n = len(segments)
+        bufs = [_transfer_buffer(data, recv and not isinstance(data, bytes)) for data in segments]
+
+        if recv:
+            # bytes segments are shifted in to consecutive slices of the pooled buffer
+            pooled = 0
+            for i in range(n):
+                if isinstance(segments[i], bytes):
+                    pooled += len(bufs[i])
+
+            pool = self._rx_pool
+            if pooled > len(pool):
+                pool = self._rx_pool = bytearray(max(pooled, 2 * len(pool)))
+            pool_addr = ctypes.addressof(pool)
+
+        # Prepare one transfer structure per segment, with rx_buf NULL if write-only
+        xfer_data = bytearray(_SPI_IOC_TRANSFER_SIZE * n)
+        speed_hz = self._xfer.speed_hz
+        bits_per_word = self._xfer.bits_per_word
+        offset = 0
+        for i in range(n):
+            buf_addr = ctypes.addressof(bufs[i])
+            if not recv:
+                rx_addr = 0
+            elif isinstance(segments[i], bytes):
+                rx_addr = pool_addr + offset
+                offset += len(bufs[i])
+            else:
+                rx_addr = buf_addr
+            struct.pack_into(_SPI_IOC_TRANSFER_FMT, xfer_data, _SPI_IOC_TRANSFER_SIZE * i,
+                             buf_addr, rx_addr, len(bufs[i]),
+                             speed_hz, 0, bits_per_word, 0, 0, 0, 0)
+
+        # Transfer
+        try:
+            _ioctl(self._fd, _SPI_IOC_MESSAGE(n), xfer_data, True)
+        except OSError as e:
+            raise OSError("SPI transfer: error")
+
+        if not recv:
+            return
+
+        # Return shifted in data with the same type as shifted out data,
+        # copying bytes segments out of the pool once
+        pool = memoryview(pool)
+        offset = 0
+        for i in range(n):
+            if isinstance(segments[i], bytes):
+                length = len(bufs[i])
+                bufs[i] = bytes(pool[offset:offset + length])
+                offset += length
+            elif isinstance(segments[i], list):
+                bufs[i] = list(bufs[i])
+
+        return bufs
 
     def deinit(self):
         """Deinit the spidev SPI device.
@@ -211,41 +455,47 @@ class SPI(object):
         return self._devpath
 
     # Mutable properties
-
-    def _get_mode(self):
-        buf = array.array('B', [0])
-
-        # Get mode
+    #
+    # Each setter validates its argument and then calls the matching
+    # _set_*_fast() method, which takes an already validated int and only
+    # issues the ioctl. Callers that validate up front can use those directly.
+
+    def _read_mode(self):
+        # Get mode, which also holds the bit order and extra flags
+        buf = self._u8
         try:
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_RD_MODE, buf, True)
+            _ioctl(self._fd, _SPI_IOC_RD_MODE, buf, True)
         except OSError as e:
             raise OSError("Getting SPI mode: error")
 
-        return buf[0] & 0x3
+        return buf[0]
+
+    def _get_mode(self):
+        return self._read_mode() & 0x3
 
     def _set_mode(self, mode):
         if not isinstance(mode, int):
             raise TypeError("Invalid mode type, should be integer.")
-        if mode not in [0, 1, 2, 3]:
+        if mode not in _VALID_MODES:
             raise ValueError("Invalid mode, can be 0, 1, 2, 3.")
 
-        # Read-modify-write mode, because the mode contains bits for other settings
-
-        # Get mode
-        buf = array.array('B', [0])
-        try:
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_RD_MODE, buf, True)
-        except OSError as e:
-            raise OSError("Getting SPI mode: error")
+        self._set_mode_fast(mode)
 
-        buf[0] = (buf[0] & ~(SPI._SPI_CPOL | SPI._SPI_CPHA)) | mode
+    def _set_mode_fast(self, mode):
+        # Modify the shadowed mode, because the mode contains bits for other settings
+        self._write_mode((self._mode_shadow & ~(_SPI_CPOL | _SPI_CPHA)) | mode)
 
+    def _write_mode(self, mode):
         # Set mode
+        buf = self._u8
+        buf[0] = mode
         try:
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_WR_MODE, buf, False)
+            _ioctl(self._fd, _SPI_IOC_WR_MODE, buf, True)
         except OSError as e:
             raise OSError("Setting SPI mode: error")
 
+        self._mode_shadow = mode
+
     mode = property(_get_mode, _set_mode)
     """Get or set the SPI mode. Can be 0, 1, 2, 3.
 
@@ -259,9 +509,9 @@ class SPI(object):
 
     def _get_baudrate(self):
         # Get max speed
-        buf = array.array('I', [0])
+        buf = self._u32
         try:
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_RD_baudrate_HZ, buf, True)
+            _ioctl(self._fd, _SPI_IOC_RD_MAX_SPEED_HZ, buf, True)
         except OSError as e:
             raise OSError("Getting SPI max speed: error")
 
@@ -271,13 +521,19 @@ class SPI(object):
         if not isinstance(baudrate, (int, float)):
             raise TypeError("Invalid baudrate type, should be integer or float.")
 
+        self._set_baudrate_fast(int(baudrate))
+
+    def _set_baudrate_fast(self, baudrate):
         # Set max speed
-        buf = array.array('I', [int(baudrate)])
+        buf = self._u32
+        buf[0] = baudrate
         try:
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_WR_baudrate_HZ, buf, False)
+            _ioctl(self._fd, _SPI_IOC_WR_MAX_SPEED_HZ, buf, True)
         except OSError as e:
             raise OSError("Setting SPI max speed: error")
 
+        self._xfer.speed_hz = baudrate
+
     baudrate = property(_get_baudrate, _set_baudrate)
     """Get or set the maximum speed in Hertz.
 
@@ -289,14 +545,7 @@ class SPI(object):
     """
 
     def _get_bit_order(self):
-        # Get mode
-        buf = array.array('B', [0])
-        try:
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_RD_MODE, buf, True)
-        except OSError as e:
-            raise OSError("Getting SPI mode: error")
-
-        if (buf[0] & SPI._SPI_LSB_FIRST) > 0:
+        if (self._read_mode() & _SPI_LSB_FIRST) > 0:
             return "lsb"
 
         return "msb"
@@ -304,26 +553,16 @@ class SPI(object):
     def _set_bit_order(self, bit_order):
         if not isinstance(bit_order, str):
             raise TypeError("Invalid bit_order type, should be string.")
-        elif bit_order.lower() not in ["msb", "lsb"]:
-            raise ValueError("Invalid bit_order, can be \"msb\" or \"lsb\".")
 
-        # Read-modify-write mode, because the mode contains bits for other settings
-
-        # Get mode
-        buf = array.array('B', [0])
-        try:
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_RD_MODE, buf, True)
-        except OSError as e:
-            raise OSError("Getting SPI mode: error")
+        lsb_first = _bit_order_flag(bit_order)
+        if lsb_first is None:
+            raise ValueError("Invalid bit_order, can be \"msb\" or \"lsb\".")
 
-        bit_order = bit_order.lower()
-        buf[0] = (buf[0] & ~SPI._SPI_LSB_FIRST) | (SPI._SPI_LSB_FIRST if bit_order == "lsb" else 0)
+        self._set_bit_order_fast(lsb_first)
 
-        # Set mode
-        try:
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_WR_MODE, buf, False)
-        except OSError as e:
-            raise OSError("Setting SPI mode: error")
+    def _set_bit_order_fast(self, lsb_first):
+        # Modify the shadowed mode, because the mode contains bits for other settings
+        self._write_mode((self._mode_shadow & ~_SPI_LSB_FIRST) | lsb_first)
 
     bit_order = property(_get_bit_order, _set_bit_order)
     """Get or set the SPI bit order. Can be "msb" or "lsb".
@@ -338,9 +577,9 @@ class SPI(object):
 
     def _get_bits_per_word(self):
         # Get bits per word
-        buf = array.array('B', [0])
+        buf = self._u8
         try:
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_RD_BITS_PER_WORD, buf, True)
+            _ioctl(self._fd, _SPI_IOC_RD_BITS_PER_WORD, buf, True)
         except OSError as e:
             raise OSError("Getting SPI bits per word: error")
 
@@ -352,13 +591,19 @@ class SPI(object):
         if bits_per_word < 0 or bits_per_word > 255:
             raise ValueError("Invalid bits_per_word, must be 0-255.")
 
+        self._set_bits_per_word_fast(bits_per_word)
+
+    def _set_bits_per_word_fast(self, bits_per_word):
         # Set bits per word
-        buf = array.array('B', [bits_per_word])
+        buf = self._u8
+        buf[0] = bits_per_word
         try:
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_WR_BITS_PER_WORD, buf, False)
+            _ioctl(self._fd, _SPI_IOC_WR_BITS_PER_WORD, buf, True)
         except OSError as e:
             raise OSError("Setting SPI bits per word: error")
 
+        self._xfer.bits_per_word = bits_per_word
+
     bits_per_word = property(_get_bits_per_word, _set_bits_per_word)
     """Get or set the SPI bits per word.
 
@@ -371,14 +616,7 @@ class SPI(object):
     """
 
     def _get_extra_flags(self):
-        # Get mode
-        buf = array.array('B', [0])
-        try:
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_RD_MODE, buf, True)
-        except OSError as e:
-            raise OSError("Getting SPI mode: error")
-
-        return buf[0] & ~(SPI._SPI_LSB_FIRST | SPI._SPI_CPHA | SPI._SPI_CPOL)
+        return self._read_mode() & ~(_SPI_LSB_FIRST | _SPI_CPHA | _SPI_CPOL)
 
     def _set_extra_flags(self, extra_flags):
         if not isinstance(extra_flags, int):
@@ -386,22 +624,11 @@ class SPI(object):
         if extra_flags < 0 or extra_flags > 255:
             raise ValueError("Invalid extra_flags, must be 0-255.")
 
-        # Read-modify-write mode, because the mode contains bits for other settings
+        self._set_extra_flags_fast(extra_flags)
 
-        # Get mode
-        buf = array.array('B', [0])
-        try:
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_RD_MODE, buf, True)
-        except OSError as e:
-            raise OSError("Getting SPI mode: error")
-
-        buf[0] = (buf[0] & (SPI._SPI_LSB_FIRST | SPI._SPI_CPHA | SPI._SPI_CPOL)) | extra_flags
-
-        # Set mode
-        try:
-            fcntl.ioctl(self._fd, SPI._SPI_IOC_WR_MODE, buf, False)
-        except OSError as e:
-            raise OSError("Setting SPI mode: error")
+    def _set_extra_flags_fast(self, extra_flags):
+        # Modify the shadowed mode, because the mode contains bits for other settings
+        self._write_mode((self._mode_shadow & (_SPI_LSB_FIRST | _SPI_CPHA | _SPI_CPOL)) | extra_flags)
 
     extra_flags = property(_get_extra_flags, _set_extra_flags)
     """Get or set the spidev extra flags. Extra flags are bitwise-ORed with the SPI mode.
@@ -417,5 +644,119 @@ class SPI(object):
     # String representation
 
     def __str__(self):
-        return "SPI (device=%s, fd=%d, mode=%s, baudrate=%d, bit_order=%s, bits_per_word=%d, extra_flags=0x%02x)" % (self.devpath, self.fd, self.mode, self.baudrate, self.bit_order, self.bits_per_word, self.extra_flags)
-
+        # One mode read covers mode, bit order and extra flags
+        mode = self._read_mode()
+        return "SPI (device=%s, fd=%d, mode=%s, baudrate=%d, bit_order=%s, bits_per_word=%d, extra_flags=0x%02x)" % (self._devpath, self._fd, mode & 0x3, self._get_baudrate(), "lsb" if mode & _SPI_LSB_FIRST else "msb", self._get_bits_per_word(), mode & ~(_SPI_LSB_FIRST | _SPI_CPHA | _SPI_CPOL))
+
+    class Batch:
+        def __init__(self, spi, size=16):
+            """Instantiate a SPI Batch object, queueing transfers on `spi` in
+            a preallocated block of transfer structures.
+
+            Args:
+                spi (SPI): SPI object to transfer on.
+                size (int): number of transfers to preallocate descriptors for.
+
+            Returns:
+                Batch: Batch object.
+
+            Raises:
+                TypeError: if `size` type is not int.
+                ValueError: if `size` value is invalid.
+
+            """
+            if not isinstance(size, int):
+                raise TypeError("Invalid size type, should be integer.")
+            elif size < 1 or size > _SPI_IOC_MESSAGE_MAX:
+                raise ValueError("Invalid size, must be 1-%d." % _SPI_IOC_MESSAGE_MAX)
+
+            self._spi = spi
+            self._xfer_data = bytearray(_SPI_IOC_TRANSFER_SIZE * size)
+            # Queued buffers, kept alive until the transfer structures pointing at them are flushed
+            self._bufs = []
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, t, value, traceback):
+            # Queued transfers are dropped if the block raised
+            if t is None:
+                self.flush()
+            else:
+                self._bufs = []
+
+        def send(self, data):
+            """Queue `data` to be shifted out, returning a view of the shifted
+            in data. The view is only valid after the batch is flushed.
+
+            A `bytearray` is transferred in place, so the view aliases `data`
+            and the shifted in data overwrites it when the batch is flushed.
+
+            Args:
+                data (bytes, bytearray, list): a byte array or list of 8-bit integers to shift out.
+
+            Returns:
+                memoryview: view of the shifted in data.
+
+            Raises:
+                TypeError: if `data` type is invalid.
+                ValueError: if data is not valid bytes, or if the batch is full.
+
+            """
+            buf = _transfer_buffer(data)
+            buf_addr = ctypes.addressof(buf)
+            self._queue(buf, buf_addr, buf_addr)
+            return memoryview(buf)
+
+        def write(self, data):
+            """Queue `data` to be shifted out, discarding the shifted in data.
+
+            Args:
+                data (bytes, bytearray, list): a byte array or list of 8-bit integers to shift out.
+
+            Raises:
+                TypeError: if `data` type is invalid.
+                ValueError: if data is not valid bytes, or if the batch is full.
+
+            """
+            buf = _transfer_buffer(data, False)
+            self._queue(buf, ctypes.addressof(buf), 0)
+
+        def flush(self):
+            """Shift out all queued transfers in a single spidev message.
+
+            Raises:
+                OSError: if an I/O or OS error occurs, or if the SPI device
+                    has been closed.
+
+            """
+            n = len(self._bufs)
+            if n == 0:
+                return
+            if self._spi._fd is None:
+                self._bufs = []
+                raise OSError("SPI transfer: device not open")
+
+            # Transfer
+            try:
+                _ioctl(self._spi._fd, _SPI_IOC_MESSAGE(n), self._xfer_data, True)
+            except OSError as e:
+                raise OSError("SPI transfer: error")
+            finally:
+                self._bufs = []
+
+        def _queue(self, buf, tx_addr, rx_addr):
+            n = len(self._bufs)
+            if n == _SPI_IOC_MESSAGE_MAX:
+                raise ValueError("Invalid batch length, must be 1-%d." % _SPI_IOC_MESSAGE_MAX)
+
+            # Grow the descriptor block if the preallocated size is exceeded
+            offset = _SPI_IOC_TRANSFER_SIZE * n
+            if offset == len(self._xfer_data):
+                self._xfer_data.extend(bytearray(offset))
+
+            spi_xfer = self._spi._xfer
+            struct.pack_into(_SPI_IOC_TRANSFER_FMT, self._xfer_data, offset,
+                             tx_addr, rx_addr, len(buf),
+                             spi_xfer.speed_hz, 0, spi_xfer.bits_per_word, 0, 0, 0, 0)
+            self._bufs.append(buf)
@@ -0,0 +1,128 @@
+import sys
+from machine.spi import SPI
+from .asserts import AssertRaises
+
+spi_device = None
+
+def test_batch():
+    print("Starting batch test...")
+
+    spi = SPI(spi_device, 0, 100000)
+
+    # Try batch, which only transfers when the with block exits
+    data = bytearray(2)
+    with spi.batch(1) as b:
+        b.write(b"\x55\xaa")
+        rx1 = b.send(data)
+        rx2 = b.send([0x0f, 0xf0])
+        # Changes before exit are still shifted out
+        data[0] = 0x12
+        data[1] = 0x34
+    assert bytes(rx1) == b"\x12\x34"
+    assert bytes(rx2) == b"\x0f\xf0"
+
+    # Flushing after deinit raises instead of passing a closed fd to ioctl
+    b = spi.batch()
+    b.write(b"\x55\xaa")
+    spi.deinit()
+    with AssertRaises(OSError):
+        b.flush()
+
+    print("Batch test passed.")
+
+def test_send_recv():
+    print("Starting send_recv test...")
+
+    spi = SPI(spi_device, 0, 100000)
+
+    # Try send_recv with each data type
+    buf_in = list(range(256))*4
+    assert spi.send_recv(buf_in) == buf_in
+    assert spi.send_recv(bytes(bytearray(buf_in))) == bytes(bytearray(buf_in))
+
+    # Try in place bytearray send_recv
+    buf_in = bytearray(buf_in)
+    buf_out = spi.send_recv(buf_in)
+    assert buf_out is buf_in
+    assert buf_out == bytearray(list(range(256))*4)
+
+    # Try send_recv into recv
+    recv = bytearray(4)
+    assert spi.send_recv(b"\x55\xaa\x0f\xf0", recv) is None
+    assert recv == bytearray(b"\x55\xaa\x0f\xf0")
+    with AssertRaises(TypeError):
+        spi.send_recv(b"\x55\xaa", bytes(2))
+    with AssertRaises(ValueError):
+        spi.send_recv(b"\x55\xaa", bytearray(1))
+
+    spi.deinit()
+
+    print("send_recv test passed.")
+
+def test_send_recv_many():
+    print("Starting send_recv_many test...")
+
+    spi = SPI(spi_device, 0, 100000)
+
+    # Try send_recv_many with mixed segment types
+    segments = [b"\x55\xaa", bytearray(b"\x0f\xf0"), [0x12, 0x34, 0x56]]
+    buf_out = spi.send_recv_many(segments)
+    assert buf_out == [b"\x55\xaa", bytearray(b"\x0f\xf0"), [0x12, 0x34, 0x56]]
+    assert isinstance(buf_out[0], bytes) and buf_out[1] is segments[1]
+
+    # Try write_many, which shifts in nothing
+    assert spi.write_many([b"\x55\xaa", [0x0f, 0xf0]]) is None
+
+    spi.deinit()
+
+    print("send_recv_many test passed.")
+
+def test_send():
+    print("Starting send test...")
+
+    spi = SPI(spi_device, 0, 100000)
+
+    # Try write-only transfers, which shift in nothing
+    assert spi.send(b"\x55\xaa") is None
+    assert spi.send(bytearray(b"\x55\xaa")) is None
+    assert spi.send([0x0f, 0xf0]) is None
+
+    spi.deinit()
+
+    print("send test passed.")
+
+def test_write_raw():
+    print("Starting write_raw test...")
+
+    spi = SPI(spi_device, 0, 100000)
+
+    # Try plain write(2) transfers
+    assert spi.write_raw(b"\x55\xaa") is None
+    assert spi.write_raw(bytearray(b"\x0f\xf0")) is None
+    assert spi.write_raw([0x12, 0x34]) is None
+
+    spi.deinit()
+
+    print("write_raw test passed.")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: micropython -m tests.test_machine_spi <spi device>")
+        print("")
+        print("  spi device     spi device with MISO/MOSI loopback installed")
+        print("")
+        print("Hint: connect a wire between MOSI and MISO, and then run this test:")
+        print("    micropython -m tests.test_machine_spi /dev/spidev1.0")
+        sys.exit(1)
+
+    spi_device = sys.argv[1]
+
+    print("Starting machine.SPI tests...")
+
+    test_batch()
+    test_send_recv()
+    test_send_recv_many()
+    test_send()
+    test_write_raw()
+
+    print("All machine.SPI tests passed.")